@@ -6,37 +6,129 @@ and --no-show to skip displaying the interactive window.
 """
 
 import os
+import time
+import shutil
+import pickle
+import hashlib
 import zipfile
 import tempfile
 import argparse
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from matplotlib.collections import PolyCollection
 import matplotlib.animation as animation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
 import geopandas as gpd
+import shapely
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy path is used without it
+    njit = None
 
 KMZ_PATH = "S1A_20251014_0551.kmz"
+CACHE_DIR = Path.home() / ".cache" / "kmz-flood"
+
+# attribute columns searched for water depth; other KML attributes are not read
+DEPTH_COLUMNS = ['depth', 'DEPTH', 'water_depth', 'Depth', 'flood_depth']
+
+POLYGON_TYPE_IDS = [shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON]
+
+# depth text labels are drawn for at most this many (deepest) features
+MAX_DEPTH_LABELS = 20
+
+# default output resolution; animations use fewer pixels per frame to keep
+# rendering and ffmpeg/pillow encoding time down
+STATIC_DPI = 100
+ANIMATION_DPI = 80
+
+# each GIF worker holds its own unpickled copy of the figure
+MAX_GIF_WORKERS = 8
 
 
 def extract_kml(kmz_path, td):
+    # only the KML member is needed; skip unpacking icons/overlays in the KMZ
     with zipfile.ZipFile(kmz_path) as zf:
-        zf.extractall(td)
-    for f in os.listdir(td):
-        if f.lower().endswith(".kml"):
-            return os.path.join(td, f)
-    raise FileNotFoundError("No .kml inside KMZ")
+        name = next((n for n in zf.namelist() if n.lower().endswith(".kml")), None)
+        if name is None:
+            raise FileNotFoundError("No .kml inside KMZ")
+        return zf.extract(name, td)
+
+
+def _prune_kml_cache(kmz_dir, keep):
+    """Remove superseded extractions of one KMZ and leftover temp dirs.
+
+    Temp dirs younger than an hour are left alone, as another run may still
+    be extracting into them.
+    """
+    for entry in kmz_dir.iterdir():
+        if entry == keep:
+            continue
+        if entry.name.startswith("tmp") and time.time() - entry.stat().st_mtime < 3600:
+            continue
+        shutil.rmtree(entry, ignore_errors=True)
+
+
+def cached_kml(kmz_path):
+    """Return the KML extracted from kmz_path, reusing an earlier extraction.
+
+    Extractions are kept under CACHE_DIR/<sha1 of KMZ path>/<mtime>-<size>/,
+    so a modified or replaced KMZ is extracted again and its old entry removed.
+    Returns None if the cache directory cannot be written.
+    """
+    st = os.stat(kmz_path)
+    kmz_dir = CACHE_DIR / hashlib.sha1(os.path.abspath(kmz_path).encode()).hexdigest()
+    cache_dir = kmz_dir / f"{st.st_mtime_ns}-{st.st_size}"
+    if cache_dir.is_dir():
+        kml = next(cache_dir.rglob("*.kml"), None)
+        if kml is not None:
+            return str(kml)
+        # entry without a KML (e.g. partly deleted by hand): rebuild it
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    try:
+        kmz_dir.mkdir(parents=True, exist_ok=True)
+        # extract next to the cache entry and move it into place, so an
+        # interrupted run never leaves a half-written KML behind
+        td = tempfile.mkdtemp(prefix="tmp", dir=kmz_dir)
+    except OSError:
+        # read-only or missing home directory: let the caller skip the cache
+        return None
+    _prune_kml_cache(kmz_dir, keep=cache_dir)
+
+    try:
+        kml = extract_kml(kmz_path, td)
+    except BaseException:
+        shutil.rmtree(td, ignore_errors=True)
+        raise
+    try:
+        os.replace(td, cache_dir)
+    except OSError:
+        # a concurrent run filled the entry first; use that one
+        shutil.rmtree(td, ignore_errors=True)
+        kml = next(cache_dir.rglob("*.kml"), None)
+        if kml is None:
+            raise
+        return str(kml)
+    return str(cache_dir / os.path.relpath(kml, td))
 
 
 def read_polygons(kml_path):
+    # pyogrio reads through GDAL's columnar API; missing depth columns are skipped
     try:
-        gdf = gpd.read_file(kml_path, driver="LIBKML")
+        gdf = gpd.read_file(kml_path, engine="pyogrio", driver="LIBKML", columns=DEPTH_COLUMNS)
     except Exception:
         gdf = gpd.read_file(kml_path)
-    gdf = gdf[gdf.geometry.notnull()]
-    gdf = gdf[gdf.geometry.geom_type.isin(["Polygon", "MultiPolygon"])].copy()
+    # vectorized type filter; missing geometries have type id -1 and drop out too
+    type_ids = shapely.get_type_id(gdf.geometry.values)
+    gdf = gdf[np.isin(type_ids, POLYGON_TYPE_IDS)].copy()
     if gdf.crs is None:
         gdf.set_crs(epsg=4326, inplace=True)
     return gdf
@@ -65,8 +157,161 @@ def _set_axes_equal(ax):
     ax.set_zlim3d([z_middle - plot_radius, z_middle + plot_radius])
 
 
+def _fill_extrusion(coords, ring_starts, ring_lens, heights, base_z, top_out, side_out):
+    """Write top-face vertices and side-wall quads for every ring in one pass.
+
+    top_out is (M, 3) and receives each vertex lifted to its ring's height;
+    side_out is (M - n_rings, 4, 3) and receives one quad per ring edge.
+    """
+    q = 0
+    for r in range(ring_starts.shape[0]):
+        s = ring_starts[r]
+        n = ring_lens[r]
+        z_top = base_z + heights[r]
+        for i in range(n):
+            top_out[s + i, 0] = coords[s + i, 0]
+            top_out[s + i, 1] = coords[s + i, 1]
+            top_out[s + i, 2] = z_top
+        for i in range(n - 1):
+            x0 = coords[s + i, 0]
+            y0 = coords[s + i, 1]
+            x1 = coords[s + i + 1, 0]
+            y1 = coords[s + i + 1, 1]
+            side_out[q, 0, 0] = x0
+            side_out[q, 0, 1] = y0
+            side_out[q, 0, 2] = base_z
+            side_out[q, 1, 0] = x1
+            side_out[q, 1, 1] = y1
+            side_out[q, 1, 2] = base_z
+            side_out[q, 2, 0] = x1
+            side_out[q, 2, 1] = y1
+            side_out[q, 2, 2] = z_top
+            side_out[q, 3, 0] = x0
+            side_out[q, 3, 1] = y0
+            side_out[q, 3, 2] = z_top
+            q += 1
+
+
+if njit is not None:
+    _fill_extrusion = njit(cache=True, fastmath=True)(_fill_extrusion)
+
+
+def _build_extrusion(coords, ring_starts, ring_lens, heights, base_z):
+    """Build top-face vertices (M, 3) and side-wall quads (M - n_rings, 4, 3).
+
+    coords holds the closed rings back to back; ring_starts/ring_lens give the
+    offset and vertex count of each ring and heights its extrusion height.
+    """
+    n_sides = len(coords) - len(ring_starts)
+    if njit is not None:
+        top = np.empty((len(coords), 3))
+        sides = np.empty((n_sides, 4, 3))
+        _fill_extrusion(coords, ring_starts, ring_lens, heights, float(base_z), top, sides)
+        return top, sides
+
+    top = np.column_stack([coords, base_z + np.repeat(heights, ring_lens)])
+    # consecutive vertex pairs that straddle two rings are not edges
+    edges = np.ones(max(len(coords) - 1, 0), dtype=bool)
+    edges[ring_starts[1:] - 1] = False
+    i0 = np.flatnonzero(edges)
+
+    # fill one preallocated quad array instead of stacking temporaries
+    sides = np.empty((n_sides, 4, 3))
+    sides[:, 0, :2] = sides[:, 3, :2] = coords[i0]
+    sides[:, 1, :2] = sides[:, 2, :2] = coords[i0 + 1]
+    sides[:, 0:2, 2] = base_z
+    sides[:, 2:4, 2] = (base_z + np.repeat(heights, ring_lens - 1))[:, None]
+    return top, sides
+
+
+class _RingCollection3D(PolyCollection):
+    """3D rings stored back to back in one flat (M, 3) vertex array.
+
+    Poly3DCollection pads ragged polygons to the longest ring and re-projects
+    the padded, masked array on every draw; for flood outlines that is ~30x
+    the real vertex count. Here the flat array is projected with a single
+    matmul per draw and the rings are drawn far to near by mean depth.
+    """
+
+    def __init__(self, verts, starts, **kwargs):
+        super().__init__([], closed=False, **kwargs)
+        self._verts_h = np.column_stack([verts, np.ones(len(verts))])
+        self._starts = starts
+        self._facecolors3d = self.get_facecolor()
+        self._edgecolors3d = self.get_edgecolor()
+
+    def do_3d_projection(self):
+        if not len(self._starts):
+            return np.nan
+        proj = self._verts_h @ self.axes.M.T
+        proj = proj[:, :3] / proj[:, 3:]
+
+        # painter's algorithm: mean projected depth per ring, farthest first
+        lens = np.diff(np.r_[self._starts, len(proj)])
+        order = np.argsort(np.add.reduceat(proj[:, 2], self._starts) / lens)[::-1]
+        rings = np.split(proj[:, :2], self._starts[1:])
+        self.set_verts([rings[i] for i in order], closed=False)
+        if len(self._facecolors3d) == len(order):
+            self.set_facecolor(self._facecolors3d[order])
+        if len(self._edgecolors3d) == len(order):
+            self.set_edgecolor(self._edgecolors3d[order])
+        return proj[:, 2].min()
+
+
+# figure unpickled once per GIF worker process
+_gif_fig = None
+
+
+def _init_gif_worker(fig_bytes):
+    global _gif_fig
+    matplotlib.use("Agg")  # workers never open windows
+    _gif_fig = pickle.loads(fig_bytes)
+    FigureCanvasAgg(_gif_fig)
+
+
+def _render_gif_frames(azims, dpi):
+    """Render the worker's figure at each azimuth as a palette GIF frame."""
+    fig = _gif_fig
+    ax = fig.axes[0]
+    fig.set_dpi(dpi)
+    frames = []
+    for azim in azims:
+        ax.view_init(elev=45, azim=azim)
+        fig.canvas.draw()
+        img = Image.frombuffer("RGBA", fig.canvas.get_width_height(), fig.canvas.buffer_rgba())
+        frames.append(img.convert("RGB").quantize())
+    return frames
+
+
+def _gif_worker_count(n_frames):
+    """Number of processes to render GIF frames with, from the usable CPUs."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))  # respects taskset/container limits
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, MAX_GIF_WORKERS, n_frames))
+
+
+def _save_gif_parallel(fig, outpath, azims, fps, dpi, workers):
+    """Render and quantize GIF frames across worker processes, then write the GIF.
+
+    Each worker gets a pickled copy of the figure and renders every
+    workers-th azimuth; only the final LZW encode runs in this process.
+    """
+    chunks = [azims[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(workers, initializer=_init_gif_worker,
+                             initargs=(pickle.dumps(fig),)) as ex:
+        results = list(ex.map(_render_gif_frames, chunks, [dpi] * workers))
+
+    frames = [None] * len(azims)
+    for i, chunk_frames in enumerate(results):
+        frames[i::workers] = chunk_frames
+    frames[0].save(outpath, save_all=True, append_images=frames[1:],
+                   duration=int(1000 / fps), loop=0)
+
+
 def plot_extruded_3d(gdf, outpath: str | None = None, show: bool = True, animate: bool = False, 
-                     show_depth_labels: bool = False, depth_column: str = None):
+                     show_depth_labels: bool = False, depth_column: str = None, dpi: int | None = None):
     """Plot the GeoDataFrame polygons with a small extrusion and depth-based coloring.
 
     Args:
@@ -74,9 +319,12 @@ def plot_extruded_3d(gdf, outpath: str | None = None, show: bool = True, animate
         outpath: if provided, save the figure to this path.
         show: if True, call plt.show(); otherwise close the figure.
         animate: if True, create a rotating animation instead of static plot.
-        show_depth_labels: if True, add text labels showing depth at polygon centroids.
+        show_depth_labels: if True, add text labels showing depth at the centroids
+                           of the MAX_DEPTH_LABELS deepest features.
         depth_column: name of the column in gdf containing depth values (in meters).
                       If None, will try 'depth', 'DEPTH', 'water_depth', or generate random depths.
+        dpi: resolution of the saved figure or animation frames. If None, uses
+             STATIC_DPI for images and ANIMATION_DPI for animations.
     """
     fig = plt.figure(figsize=(14, 10))
     ax = fig.add_subplot(111, projection="3d")
@@ -99,7 +347,7 @@ def plot_extruded_3d(gdf, outpath: str | None = None, show: bool = True, animate
         depths = gdf[depth_column].values
     else:
         # Try common depth column names
-        for col in ['depth', 'DEPTH', 'water_depth', 'Depth', 'flood_depth']:
+        for col in DEPTH_COLUMNS:
             if col in gdf.columns:
                 depths = gdf[col].values
                 print(f"Using depth column: {col}")
@@ -119,80 +367,65 @@ def plot_extruded_3d(gdf, outpath: str | None = None, show: bool = True, animate
     
     print(f"Depth range: {min_depth:.2f}m to {max_depth:.2f}m")
 
-    # track min/max for axis limits
-    xs = []
-    ys = []
-
-    # Water color palette - realistic flood water colors with depth variation
-    
-    for idx, geom in enumerate(gdf.geometry):
-        if geom.geom_type == "Polygon":
-            polys = [geom]
-        else:
-            polys = list(geom.geoms)
-
-        # Get depth and color for this feature
-        depth = depths[idx]
-        norm_depth = normalized_depths[idx]
-        
-        # Color mapping: light blue (shallow) to dark blue (deep)
-        # Using a gradient from cyan/light blue to navy/dark blue
-        water_color = plt.cm.Blues(0.4 + norm_depth * 0.6)  # 0.4 to 1.0 range in Blues colormap
-        water_rgba = tuple(water_color[:3]) + (0.7,)
-        side_rgba = tuple(c * 0.7 for c in water_color[:3]) + (0.6,)
-        edge_color = tuple(c * 1.2 if c * 1.2 <= 1 else 1 for c in water_color[:3])
-        
-        for poly in polys:
-            exterior = poly.exterior
-            coords = list(exterior.coords)
-            # separate x and y arrays for limits
-            x = [c[0] for c in coords]
-            y = [c[1] for c in coords]
-            xs.extend(x)
-            ys.extend(y)
-
-            # Use actual depth to set extrusion height
-            actual_extrude_h = depth * 0.05  # scale depth to reasonable visual height
-            
-            # create top and bottom faces as 3D polygons
-            top = [(xi, yi, base_z + actual_extrude_h) for xi, yi in zip(x, y)]
-            bottom = [(xi, yi, base_z) for xi, yi in zip(x, y)]
-
-            # Add water surface (top face) with depth-based color
-            poly_top = Poly3DCollection([top], facecolor=water_rgba, alpha=0.7, linewidths=0.8)
-            poly_top.set_edgecolor(edge_color)
-            ax.add_collection3d(poly_top)
-
-            # Add bottom face (submerged ground) - darker
-            poly_bottom = Poly3DCollection([bottom], facecolor='#1a1a1a', alpha=0.3, linewidths=0)
-            ax.add_collection3d(poly_bottom)
-
-            # add side walls as quads between consecutive vertices (water depth)
-            side_quads = []
-            n = len(coords)
-            for i in range(n - 1):
-                x0, y0 = coords[i][0], coords[i][1]
-                x1, y1 = coords[i + 1][0], coords[i + 1][1]
-                quad = [
-                    (x0, y0, base_z),
-                    (x1, y1, base_z),
-                    (x1, y1, base_z + actual_extrude_h),
-                    (x0, y0, base_z + actual_extrude_h),
-                ]
-                side_quads.append(quad)
-
-            # Water sides with depth-based gradient
-            poly_sides = Poly3DCollection(side_quads, facecolor=side_rgba, alpha=0.6, linewidths=0.3)
-            poly_sides.set_edgecolor(edge_color)
-            ax.add_collection3d(poly_sides)
-            
-            # Add depth label at centroid if requested
-            if show_depth_labels:
-                centroid = poly.centroid
-                ax.text(centroid.x, centroid.y, base_z + actual_extrude_h + 0.02, 
-                       f'{depth:.1f}m', fontsize=9, color='white', weight='bold',
-                       bbox=dict(boxstyle='round,pad=0.4', facecolor='navy', alpha=0.8, edgecolor='cyan'),
-                       ha='center', va='bottom')
+    # Water color palette - realistic flood water colors with depth variation.
+    # Color mapping: light blue (shallow) to dark blue (deep), using the 0.4 to
+    # 1.0 range of the Blues colormap, looked up once for all features.
+    water_rgba = plt.cm.Blues(0.4 + normalized_depths * 0.6)
+    water_rgba[:, 3] = 0.7
+    side_rgba = water_rgba.copy()
+    side_rgba[:, :3] *= 0.7
+    side_rgba[:, 3] = 0.6
+    edge_colors = np.minimum(water_rgba[:, :3] * 1.2, 1.0)
+
+    # Explode MultiPolygons and pull every exterior ring out of GEOS in one
+    # vectorized call; rings are laid out back to back in the flat (M, 2) array.
+    parts, part_feature = shapely.get_parts(gdf.geometry.values, return_index=True)
+    coords, ring_idx = shapely.get_coordinates(shapely.get_exterior_ring(parts), return_index=True)
+    # offset and vertex count of each ring in coords
+    if len(coords):
+        ring_starts = np.r_[0, np.flatnonzero(np.diff(ring_idx)) + 1]
+    else:
+        ring_starts = np.empty(0, dtype=np.intp)
+    ring_lens = np.diff(np.r_[ring_starts, len(coords)])
+    ring_parts = ring_idx[ring_starts]
+    ring_feature = part_feature[ring_parts]
+    # each ring of K vertices contributes K-1 side quads
+    side_counts = ring_lens - 1
+
+    # Use actual depth to set extrusion height (scaled to a reasonable visual height)
+    heights = np.asarray(depths, dtype=float)[ring_feature] * 0.05
+
+    # Faces are built for all rings at once and added as one collection per
+    # face type, so the figure holds 3 artists instead of 3 per polygon.
+    top_verts, side_faces = _build_extrusion(coords, ring_starts, ring_lens, heights, base_z)
+    bottom_verts = np.column_stack([coords, np.full(len(coords), base_z)])
+
+    # Add depth label at centroid if requested
+    # (one Text artist each, so only the deepest features are labelled)
+    if show_depth_labels and len(coords):
+        centroids = shapely.centroid(gdf.geometry.values)
+        cx, cy = shapely.get_x(centroids), shapely.get_y(centroids)
+        for i in np.argsort(depths)[-MAX_DEPTH_LABELS:]:
+            ax.text(cx[i], cy[i], base_z + depths[i] * 0.05 + 0.02, 
+                   f'{depths[i]:.1f}m', fontsize=9, color='white', weight='bold',
+                   bbox=dict(boxstyle='round,pad=0.4', facecolor='navy', alpha=0.8, edgecolor='cyan'),
+                   ha='center', va='bottom')
+
+    if len(coords):
+        # Bottom faces (submerged ground) - darker
+        ax.add_collection(_RingCollection3D(bottom_verts, ring_starts, facecolor='#1a1a1a',
+                                            alpha=0.3, linewidths=0), autolim=False)
+
+        # Water sides with depth-based gradient
+        ax.add_collection3d(Poly3DCollection(side_faces,
+                                             facecolors=np.repeat(side_rgba[ring_feature], side_counts, axis=0),
+                                             edgecolors=np.repeat(edge_colors[ring_feature], side_counts, axis=0),
+                                             alpha=0.6, linewidths=0.3))
+
+        # Water surface with depth-based color
+        ax.add_collection(_RingCollection3D(top_verts, ring_starts, facecolors=water_rgba[ring_feature],
+                                            edgecolors=edge_colors[ring_feature],
+                                            alpha=0.7, linewidths=0.8), autolim=False)
 
     # Style axis labels with water theme
     ax.set_xlabel("Longitude")
@@ -212,10 +445,13 @@ def plot_extruded_3d(gdf, outpath: str | None = None, show: bool = True, animate
     ax.grid(True, linestyle='--', alpha=0.3, color='#4a90e2')
 
     # set limits based on data with a small margin
-    if xs and ys:
-        margin = 0.01 * max(max(xs) - min(xs), max(ys) - min(ys)) if len(xs) > 1 and len(ys) > 1 else 0.001
-        ax.set_xlim(min(xs) - margin, max(xs) + margin)
-        ax.set_ylim(min(ys) - margin, max(ys) + margin)
+    if len(coords):
+        xmin, ymin = coords.min(axis=0)
+        xmax, ymax = coords.max(axis=0)
+        span = max(xmax - xmin, ymax - ymin)
+        margin = 0.01 * span if span else 0.001
+        ax.set_xlim(xmin - margin, xmax + margin)
+        ax.set_ylim(ymin - margin, ymax + margin)
         ax.set_zlim(-0.02, max_depth * 0.06)  # Scale z-axis based on max depth
 
     _set_axes_equal(ax)
@@ -225,33 +461,53 @@ def plot_extruded_3d(gdf, outpath: str | None = None, show: bool = True, animate
     if animate:
         # Create 360° rotation animation
         print("Creating 360° rotation animation...")
-        
+
+        frames = np.arange(0, 360, 2)  # 2-degree steps = 180 frames
+        outpath = Path(outpath) if outpath else None
+        workers = _gif_worker_count(len(frames))
+        # GIF frames are independent, so they are rendered in worker processes
+        parallel_gif = outpath is not None and outpath.suffix.lower() == '.gif' and workers > 1
+
+        # The scene is static and only the camera moves, so the batched
+        # collections are built once and each frame just updates the view.
+        # Blitting is not used: a 3D view change moves the panes, grid and
+        # ticks too, so the whole axes has to be redrawn anyway. The workers
+        # draw their own copies, so the parent only draws when it renders.
+        if show or not parallel_gif:
+            fig.canvas.draw()
+
         def update(frame):
             ax.view_init(elev=45, azim=frame)
-            return ax,
+            return ()
 
-        frames = np.arange(0, 360, 2)  # 2-degree steps = 180 frames
-        anim = animation.FuncAnimation(fig, update, frames=frames, interval=50, blit=False)
+        def make_animation():
+            return animation.FuncAnimation(fig, update, frames=frames, interval=50, blit=False,
+                                           cache_frame_data=False)
+
+        savefig_kwargs = {'facecolor': fig.get_facecolor()}
 
         if outpath:
-            outpath = Path(outpath)
             outpath.parent.mkdir(parents=True, exist_ok=True)
             
             # Determine format from extension
             ext = outpath.suffix.lower()
-            if ext == '.gif':
+            if parallel_gif:
+                print(f"Saving animation as GIF to: {outpath.absolute()} ({workers} processes)")
+                _save_gif_parallel(fig, outpath, frames, fps=20, dpi=dpi or ANIMATION_DPI, workers=workers)
+            elif ext == '.gif':
                 print(f"Saving animation as GIF to: {outpath.absolute()}")
-                anim.save(outpath, writer='pillow', fps=20, dpi=100)
+                make_animation().save(outpath, writer='pillow', fps=20, dpi=dpi or ANIMATION_DPI, savefig_kwargs=savefig_kwargs)
             else:
                 # Default to MP4
                 if ext != '.mp4':
                     outpath = outpath.with_suffix('.mp4')
                 print(f"Saving animation as MP4 to: {outpath.absolute()}")
-                anim.save(outpath, writer='ffmpeg', fps=20, dpi=100)
+                make_animation().save(outpath, writer='ffmpeg', fps=20, dpi=dpi or ANIMATION_DPI, savefig_kwargs=savefig_kwargs)
             print(f"✓ Animation saved successfully!")
 
         if show:
             print("Displaying animated figure...")
+            anim = make_animation()  # keep a reference while the window is open
             plt.show()
         else:
             print("Skipping interactive display (--no-show)")
@@ -262,7 +518,7 @@ def plot_extruded_3d(gdf, outpath: str | None = None, show: bool = True, animate
             outpath = Path(outpath)
             outpath.parent.mkdir(parents=True, exist_ok=True)
             print(f"Saving figure to: {outpath.absolute()}")
-            fig.savefig(outpath, dpi=200, bbox_inches="tight")
+            fig.savefig(outpath, dpi=dpi or STATIC_DPI, bbox_inches="tight")
             print(f"✓ Saved figure to: {outpath.absolute()}")
 
         if show:
@@ -279,6 +535,8 @@ def main():
     parser.add_argument("--output", "-o", default=None, help="If provided, save the figure to this file path (png, pdf, mp4, gif, etc.)")
     parser.add_argument("--no-show", action="store_true", help="Do not open the interactive window after plotting")
     parser.add_argument("--animate", "-a", action="store_true", help="Create a 360° rotation animation (MP4 or GIF)")
+    parser.add_argument("--dpi", type=int, default=None,
+                        help=f"Output resolution (default: {STATIC_DPI} for images, {ANIMATION_DPI} for animations)")
     args = parser.parse_args()
 
     print(f"🔧 Arguments parsed:")
@@ -286,16 +544,24 @@ def main():
     print(f"   Output: {args.output}")
     print(f"   No-show: {args.no_show}")
     print(f"   Animate: {args.animate}")
+    print(f"   DPI: {args.dpi}")
     print()
 
+    if args.no_show:
+        # no window will be opened; render straight to the Agg raster backend
+        matplotlib.use("Agg")
+
     if not os.path.exists(args.kmz):
         raise FileNotFoundError(f"KMZ not found: {args.kmz}")
-    with tempfile.TemporaryDirectory() as td:
-        kml = extract_kml(args.kmz, td)
+    kml = cached_kml(args.kmz)
+    if kml is not None:
         gdf = read_polygons(kml)
+    else:
+        with tempfile.TemporaryDirectory() as td:
+            gdf = read_polygons(extract_kml(args.kmz, td))
 
     print(f"📊 Loaded {len(gdf)} flood polygons from KMZ")
-    plot_extruded_3d(gdf, outpath=args.output, show=not args.no_show, animate=args.animate)
+    plot_extruded_3d(gdf, outpath=args.output, show=not args.no_show, animate=args.animate, dpi=args.dpi)
 
 
 if __name__ == "__main__":
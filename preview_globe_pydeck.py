@@ -1,13 +1,17 @@
 # filename: preview_globe_pydeck.py
 
-import json
 import pydeck as pdk
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json also parses bytes
+    from json import loads as json_loads
+
 GEOJSON_PATH = "S1A_20251014_0551.geojson"
 
 def main():
-    with open(GEOJSON_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(GEOJSON_PATH, "rb") as f:
+        data = json_loads(f.read())
 
     layer = pdk.Layer(
         "GeoJsonLayer",
@@ -9,13 +9,12 @@ import geopandas as gpd
 KMZ_PATH = "S1A_20251014_0551.kmz"
 
 def extract_kml(kmz_path, td):
+    # only the KML member is needed; skip unpacking icons/overlays in the KMZ
     with zipfile.ZipFile(kmz_path) as zf:
-        zf.extractall(td)
-    for root, _, files in os.walk(td):
-        for f in files:
-            if f.lower().endswith(".kml"):
-                return os.path.join(root, f)
-    raise FileNotFoundError("No .kml inside KMZ")
+        name = next((n for n in zf.namelist() if n.lower().endswith(".kml")), None)
+        if name is None:
+            raise FileNotFoundError("No .kml inside KMZ")
+        return zf.extract(name, td)
 
 def main():
     if not os.path.exists(KMZ_PATH):
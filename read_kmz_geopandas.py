@@ -4,43 +4,56 @@ import os
 import json
 import zipfile
 import tempfile
+import numpy as np
+import pyogrio
+import shapely
 import geopandas as gpd
 
 KMZ_PATH = "S1A_20251014_0551.kmz"
 OUT_GEOJSON = "S1A_20251014_0551.geojson"
 
+POLYGON_TYPE_IDS = [shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON]
+
 def extract_kml_from_kmz(kmz_path: str, tmpdir: str) -> str:
     if not os.path.exists(kmz_path):
         raise FileNotFoundError(f"Not found: {kmz_path}")
     with zipfile.ZipFile(kmz_path) as zf:
-        zf.extractall(tmpdir)
-    # find first kml
-    for root, _, files in os.walk(tmpdir):
-        for f in files:
-            if f.lower().endswith(".kml"):
-                return os.path.join(root, f)
-    raise FileNotFoundError("No .kml inside KMZ")
+        # find first kml and extract only that member
+        name = next((n for n in zf.namelist() if n.lower().endswith(".kml")), None)
+        if name is None:
+            raise FileNotFoundError("No .kml inside KMZ")
+        return zf.extract(name, tmpdir)
 
 def read_kml_to_gdf(kml_path: str) -> gpd.GeoDataFrame:
-    # Try LIBKML first, then KML (depends on GDAL build)
+    # Try LIBKML via pyogrio first, then KML (depends on GDAL build)
     try:
-        gdf = gpd.read_file(kml_path, driver="LIBKML")
+        gdf = gpd.read_file(kml_path, engine="pyogrio", driver="LIBKML")
     except Exception:
         gdf = gpd.read_file(kml_path, driver="KML")
-    gdf = gdf[gdf.geometry.notnull()].copy()
-    gdf = gdf[gdf.geometry.geom_type.isin(["Polygon", "MultiPolygon"])].copy()
+    # vectorized type filter; missing geometries have type id -1 and drop out too
+    type_ids = shapely.get_type_id(gdf.geometry.values)
+    gdf = gdf[np.isin(type_ids, POLYGON_TYPE_IDS)].copy()
     if gdf.crs is None:
         gdf.set_crs(epsg=4326, inplace=True)
     else:
         gdf = gdf.to_crs(epsg=4326)
-    # Optional: clean small invalid geometries
-    gdf["geometry"] = gdf["geometry"].buffer(0)
-    gdf = gdf[gdf.geometry.is_valid]
+    # Optional: clean small invalid geometries. Only the invalid ones are
+    # repaired; buffer(0) keeps the output polygonal
+    geoms = gdf.geometry.values.copy()
+    bad = ~shapely.is_valid(geoms)
+    geoms[bad] = shapely.buffer(geoms[bad], 0)
+    gdf = gdf.set_geometry(gpd.GeoSeries(geoms, index=gdf.index, crs=gdf.crs))
     return gdf
 
 def export_geojson(gdf: gpd.GeoDataFrame, out_path: str):
-    # Ensure FeatureCollection with EPSG:4326 coordinates
-    gdf.to_file(out_path, driver="GeoJSON")
+    # Ensure FeatureCollection with EPSG:4326 coordinates; 6 decimals (~0.1 m)
+    # is plenty for the preview and keeps the file and embedded HTML small
+    pyogrio.write_dataframe(
+        gdf,
+        out_path,
+        driver="GeoJSON",
+        layer_options={"COORDINATE_PRECISION": "6"},
+    )
     print(f"Wrote GeoJSON: {out_path} ({len(gdf)} features)")
 
 def main():